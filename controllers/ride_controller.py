@@ -82,22 +82,21 @@ async def debug_url_parsing():
 
 async def suggest_stations(request: SuggestStationsRequest):
     """Suggest subway stations based on extracted names"""
-    from services.transit_service import load_subway_stations, find_matching_stations
-    
-    all_stations_data = load_subway_stations()
-    all_stations = []
-    for line_stations in all_stations_data.values():
-        all_stations.extend(line_stations)
-    
-    matches = find_matching_stations(request.extracted_name, all_stations)
-    
+    from services.transit_service import match_stations, get_station_index
+
+    # Matching structures are built once and cached in the service;
+    # match_stations also memoizes results per extracted name
+    station_to_lines = get_station_index()[3]
+
+    matches = match_stations(request.extracted_name)
+
     return {
         "extracted_name": request.extracted_name,
         "suggestions": [
             {
                 "station_name": match[0],
                 "confidence": match[1],
-                "lines": [line for line, stations in all_stations_data.items() if match[0] in stations]
+                "lines": station_to_lines.get(match[0], [])
             }
             for match in matches
         ],
@@ -111,27 +110,27 @@ async def add_test_data(db: Session = Depends(get_db)):
     next_ride_number = (max_ride or 0) + 1
     
     test_rides = [
-        SubwayRide(
-            ride_number=next_ride_number,
-            line="1",
-            board_stop="Times Sq-42 St",
-            depart_stop="14 St",
-            date=date.today(),
-            transferred=False
-        ),
-        SubwayRide(
-            ride_number=next_ride_number + 1,
-            line="N",
-            board_stop="14 St-Union Sq",
-            depart_stop="Canal St",
-            date=date.today(),
-            transferred=True
-        )
+        {
+            "ride_number": next_ride_number,
+            "line": "1",
+            "board_stop": "Times Sq-42 St",
+            "depart_stop": "14 St",
+            "date": date.today(),
+            "transferred": False
+        },
+        {
+            "ride_number": next_ride_number + 1,
+            "line": "N",
+            "board_stop": "14 St-Union Sq",
+            "depart_stop": "Canal St",
+            "date": date.today(),
+            "transferred": True
+        }
     ]
-    
+
     try:
-        for ride in test_rides:
-            db.add(ride)
+        # Single bulk INSERT instead of one add() per ride
+        db.bulk_insert_mappings(SubwayRide, test_rides)
         db.commit()
         return {"message": f"✅ Added {len(test_rides)} test rides successfully!"}
     except Exception as e:
@@ -2,6 +2,8 @@
 NYC Subway Tracker API
 A FastAPI application for tracking subway rides and parsing Google Maps transit routes
 """
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,6 +12,7 @@ from sqlalchemy.orm import Session
 # Import modules
 from models import get_db
 from utils.helpers import get_app_port
+from services.transit_service import close_async_client
 from controllers.ride_controller import (
     get_root,
     debug_url_parsing,
@@ -34,11 +37,17 @@ from controllers.ride_controller import (
 # -------------------------------
 # APP INITIALIZATION
 # -------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared HTTP client on shutdown"""
+    yield
+    await close_async_client()
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application"""
-    
+
     # Create FastAPI app
-    app = FastAPI(title="NYC Subway Tracker API")
+    app = FastAPI(title="NYC Subway Tracker API", lifespan=lifespan)
     
     # Add CORS middleware
     app.add_middleware(
@@ -60,7 +69,7 @@ def create_app() -> FastAPI:
     
     # Register routes
     register_routes(app)
-    
+
     return app
 
 def register_routes(app: FastAPI):